@@ -3,10 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
-
-import aiohttp
-import voluptuous as vol
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -14,11 +11,18 @@ from homeassistant.const import (
     Platform,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import PlantSipAPI
-from .const import DOMAIN, SCAN_INTERVAL, CONF_API_KEY # Import CONF_API_KEY
+from .const import (
+    DOMAIN,
+    SCAN_INTERVAL,
+    CONF_API_KEY,
+    DEVICE_DETAILS_TTL,
+    MAX_BACKOFF_INTERVAL,
+    MAX_CONCURRENT_REQUESTS,
+)
 from .exceptions import PlantSipError
 
 _LOGGER = logging.getLogger(__name__)
@@ -34,28 +38,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up PlantSip from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     
+    # No session passed: the API client owns a dedicated session with a
+    # connector tuned for the coordinator's fan-out to a single host, so
+    # pooled connections stay warm between updates instead of paying TCP/TLS
+    # handshakes on every cycle. Closed in async_unload_entry.
     api = PlantSipAPI(
         host=entry.data[CONF_HOST],
         api_key=entry.data[CONF_API_KEY], # Use CONF_API_KEY
-        session=async_get_clientsession(hass),
     )
 
     coordinator = PlantSipDataUpdateCoordinator(hass, api)
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
 
-    hass.data[DOMAIN][entry.entry_id] = {
-        "api": api,
-        "coordinator": coordinator,
-    }
+        hass.data[DOMAIN][entry.entry_id] = {
+            "api": api,
+            "coordinator": coordinator,
+        }
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except Exception:
+        # The client owns its session, so a failed setup (e.g. first refresh
+        # raising ConfigEntryNotReady) must close it here; otherwise every
+        # retry of HA's setup loop would leak a session and its connector.
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await api.async_close()
+        raise
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data["api"].async_close()
     return unload_ok
 
 class PlantSipDataUpdateCoordinator(DataUpdateCoordinator):
@@ -68,99 +84,342 @@ class PlantSipDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=SCAN_INTERVAL,
+            # Skip listener callbacks (and the resulting state writes for
+            # every entity) when a poll returns identical data; water-amount
+            # and status fields rarely change between cycles.
+            always_update=False,
         )
         self.api = api
         self.last_update_success = True
+        # Per-device entry cache so unchanged devices reuse their dicts
+        # across updates instead of being rebuilt every cycle.
+        self._device_entry_cache: dict[str, dict] = {}
+        # Device details are largely static (channels, names) while status
+        # changes every cycle; cache them per device for DEVICE_DETAILS_TTL
+        # so steady-state updates on the per-device path only fetch status.
+        self._details_cache: dict[str, tuple[float, dict]] = {}
+        # Per-device exponential backoff: a device that keeps failing (e.g.
+        # timing out) would otherwise stall every gather cycle, since the
+        # update's wall time is the slowest device's round-trip.
+        self._failure_count: dict[str, int] = {}
+        self._next_probe: dict[str, float] = {}
+        # Bound the per-device fan-out so a large installation does not put
+        # all N requests in flight at once and oversubscribe the connector.
+        self._fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Last firmware version seen per device, to detect changes that
+        # must be propagated to the device registry.
+        self._last_fw: dict[str, str] = {}
+        # O(1) channel lookup for entities, rebuilt on every update: maps
+        # (device_id, channel_id) to the channel dict so per-channel entities
+        # do not scan the channels list on every property access.
+        self.channel_index: dict[tuple[str, int], dict] = {}
+
+    def _make_device_entry(self, device_id, full_device_details, status):
+        """Build (or reuse) the coordinator data entry for a device.
+
+        When the device payload is identical to the previous update, the
+        cached entry dict is reused, so an idle installation allocates
+        O(changed devices) instead of O(all devices × fields) per cycle.
+        Entries are never mutated in place: with always_update=False the
+        coordinator compares the previous and new data via ==, and in-place
+        swaps would make changed data look identical.
+        """
+        cached = self._device_entry_cache.get(device_id)
+        if cached is not None and cached.get("device") == full_device_details:
+            if cached.get("status") == status and cached.get("available"):
+                return cached
+            entry = {
+                "device": cached["device"],
+                "status": status,
+                "available": True
+            }
+            self._device_entry_cache[device_id] = entry
+            return entry
+        entry = {
+            "device": full_device_details,
+            "status": status,
+            "available": True
+        }
+        self._device_entry_cache[device_id] = entry
+        return entry
+
+    def _process_channels(self, device_id, full_device_details):
+        """Validate the channels list of a full device details payload.
+
+        Returns only the channel dicts that carry both 'id' and
+        'channel_index'; malformed entries are logged and dropped.
+        """
+        # Ensure channels exist and are properly formatted (from full_device_details)
+        channels_from_full_details = full_device_details.get("channels", [])
+        if type(channels_from_full_details) is not list:
+            _LOGGER.error("Invalid channels format in full details for device %s: %s", device_id, channels_from_full_details)
+            return []
+
+        # Fast path: in steady state every channel is well-formed, so one
+        # all() sweep lets us reuse the original list without rebuilding it.
+        # Channels are kept sorted by channel_index so entities are created
+        # (and displayed) in display order; Timsort on an already-sorted
+        # list is a cheap O(n) pass.
+        if all(
+            type(channel_api_data) is dict
+            and channel_api_data.get("id") is not None
+            and channel_api_data.get("channel_index") is not None
+            for channel_api_data in channels_from_full_details
+        ):
+            channels_from_full_details.sort(key=lambda ch: ch["channel_index"])
+            return channels_from_full_details
+
+        # Cold path: something is malformed, filter and log the damage.
+        # This runs per device on every update, so keep the loop tight: one
+        # comprehension with locally bound names instead of per-channel
+        # attribute lookups and log calls.
+        processed_channels_data = [
+            channel_api_data
+            for channel_api_data in channels_from_full_details
+            if type(channel_api_data) is dict
+            and channel_api_data.get("id") is not None
+            and channel_api_data.get("channel_index") is not None
+        ]
+        dropped = len(channels_from_full_details) - len(processed_channels_data)
+        if dropped:
+            # Malformed entries should not happen if the Channel schema
+            # guarantees 'id' and 'channel_index'; aggregate the log instead
+            # of emitting one error per channel.
+            _LOGGER.error(
+                "Dropped %d malformed channel entries for device %s (not a dict or missing 'id'/'channel_index'): %s",
+                dropped,
+                device_id,
+                channels_from_full_details,
+            )
+        processed_channels_data.sort(key=lambda ch: ch["channel_index"])
+        return processed_channels_data
+
+    def _process_full_device_item(self, full_device_item):
+        """Turn one item of the batched devices response into a data entry.
+
+        Each item is a full device details dict with the latest status
+        embedded under 'status'. Returns a (device_id, device_entry) tuple,
+        or None if the item is invalid.
+        """
+        if type(full_device_item) is not dict:
+            _LOGGER.error("Invalid device data format in batched response: %s", full_device_item)
+            return None
+
+        # Test the raw value before str(): a missing id would otherwise
+        # become the truthy string "None" and slip past the guard.
+        raw_device_id = full_device_item.get("device_id")
+        if not raw_device_id:
+            _LOGGER.error("Batched device data missing device_id: %s", full_device_item)
+            return None
+        device_id = str(raw_device_id)
+
+        status = full_device_item.pop("status", {})
+        if type(status) is not dict:
+            _LOGGER.error("Invalid status format in batched response for device %s: %s", device_id, status)
+            status = {}
+
+        full_device_item["channels"] = self._process_channels(device_id, full_device_item)
+
+        return device_id, self._make_device_entry(device_id, full_device_item, status)
+
+    async def _fetch_one_device_bounded(self, device_summary_item, prefetched_statuses=None):
+        """Run _fetch_one_device under the shared concurrency bound."""
+        async with self._fetch_semaphore:
+            return await self._fetch_one_device(device_summary_item, prefetched_statuses)
+
+    async def _fetch_one_device(self, device_summary_item, prefetched_statuses=None):
+        """Fetch details and status for a single device summary.
+
+        Returns a (device_id, device_entry) tuple, or None if the summary is
+        invalid. Fetch/processing errors are caught here and mapped to an
+        entry with available=False, so callers can gather these concurrently.
+        Statuses already fetched in batch can be passed via
+        prefetched_statuses to skip the per-device status request.
+        """
+        device_id = None # Initialize device_id here for broader scope in error handling
+        try:
+            if type(device_summary_item) is not dict:
+                _LOGGER.error("Invalid device summary data format: %s", device_summary_item)
+                return None
+
+            raw_device_id = device_summary_item.get("device_id")
+            if not raw_device_id:
+                _LOGGER.error("Device summary missing device_id: %s", device_summary_item)
+                return None
+            device_id = str(raw_device_id)
+
+            now = time.monotonic()
+            if self._next_probe.get(device_id, 0) > now:
+                # Still inside the backoff window after repeated failures;
+                # skip the network round-trips and keep it unavailable.
+                _LOGGER.debug("Device %s in backoff, skipping status fetch this cycle", device_id)
+                cached_entry = self._device_entry_cache.get(device_id)
+                if cached_entry is not None:
+                    return device_id, {**cached_entry, "available": False}
+                return device_id, {
+                    "device": {"device_id": device_id, "name": device_summary_item.get("name", device_id), "channels": []},
+                    "status": {}, "available": False}
+
+            # Fetch full device details to get complete channel information;
+            # reuse the cached copy while it is fresh since only status
+            # changes between cycles.
+            cached_details = self._details_cache.get(device_id)
+            if cached_details is not None and now - cached_details[0] < DEVICE_DETAILS_TTL:
+                full_device_details = cached_details[1]
+            else:
+                full_device_details = await self.api.get_device_details(device_id)
+                if type(full_device_details) is not dict:
+                    _LOGGER.error("Invalid full device details format for %s: %s", device_id, full_device_details)
+                    return device_id, { # Store minimal info to mark as unavailable
+                        "device": {"device_id": device_id, "name": device_summary_item.get("name", device_id), "channels": []},
+                        "status": {}, "available": False}
+                # Update the 'channels' in the full_device_details object that will be stored.
+                full_device_details["channels"] = self._process_channels(device_id, full_device_details)
+                self._details_cache[device_id] = (now, full_device_details)
+
+            status = None
+            if prefetched_statuses is not None:
+                status = prefetched_statuses.get(device_id)
+            if status is None:
+                status = await self.api.get_device_status(device_id)
+
+            self._failure_count.pop(device_id, None)
+            self._next_probe.pop(device_id, None)
+
+            # Store the full device details, reusing the cached entry when unchanged.
+            return device_id, self._make_device_entry(device_id, full_device_details, status)
+        except Exception as device_err:
+            # No exc_info here: formatting a traceback per device per cycle is
+            # costly; the outermost unexpected-error catch still includes it.
+            _LOGGER.error("Error processing device %s: %s", device_id or device_summary_item.get("device_id", "unknown"), str(device_err))
+            # Mark this specific device as unavailable if we have an ID for it
+            current_device_id_for_error = device_id or str(device_summary_item.get("device_id","unknown_device_at_error"))
+            # Cached details may be the reason for the failure; refetch next cycle.
+            self._details_cache.pop(current_device_id_for_error, None)
+            failures = self._failure_count.get(current_device_id_for_error, 0) + 1
+            self._failure_count[current_device_id_for_error] = failures
+            self._next_probe[current_device_id_for_error] = (
+                time.monotonic() + min(2 ** failures, MAX_BACKOFF_INTERVAL)
+            )
+            return current_device_id_for_error, {
+                "device": {"device_id": current_device_id_for_error, "name": device_summary_item.get("name", current_device_id_for_error), "channels": []},
+                "status": {},
+                "available": False
+            }
+
+    def _update_firmware_versions(self, data) -> None:
+        """Propagate firmware version changes to the device registry.
+
+        Entities record sw_version in their DeviceInfo only when they are
+        created; when a device is flashed afterwards, patch the registry
+        entry once per change instead of rebuilding entities.
+        """
+        registry = None
+        for device_id, entry in data.items():
+            firmware = entry.get("status", {}).get("firmware_version")
+            if not firmware or self._last_fw.get(device_id) == firmware:
+                continue
+            if device_id in self._last_fw:
+                if registry is None:
+                    registry = dr.async_get(self.hass)
+                device = registry.async_get_device(identifiers={(DOMAIN, device_id)})
+                if device is not None:
+                    registry.async_update_device(device.id, sw_version=firmware)
+            self._last_fw[device_id] = firmware
+
+    async def async_update_channel_config(self, device_id, channel_id, config) -> bool:
+        """Push a channel configuration change to the API.
+
+        Returns True on success; API errors propagate to the caller.
+        """
+        await self.api.update_channel_config(device_id, channel_id, config)
+        return True
 
     async def _async_update_data(self):
         """Fetch data from API endpoint."""
         try:
-            device_summaries = await self.api.get_devices()
-            _LOGGER.debug("Processing device summaries: %s", device_summaries)
+            # Prefer the batched route (one round-trip for all devices,
+            # channels and status); fall back to per-device requests when the
+            # server does not support it.
+            full_device_items = await self.api.get_all_devices_full()
+            if full_device_items is not None:
+                device_summaries = full_device_items
+            else:
+                device_summaries = await self.api.get_devices()
+            # Log only the count: stringifying the whole payload dominates
+            # debug-mode CPU once installations grow.
+            _LOGGER.debug("Processing %d device summaries", len(device_summaries))
             data = {}
-            active_device_ids_from_api = {str(ds.get("device_id")) for ds in device_summaries if ds.get("device_id")}
+            active_device_ids_from_api = {
+                str(did)
+                for ds in device_summaries
+                if type(ds) is dict and (did := ds.get("device_id"))
+            }
 
+            # Drop cached details for devices no longer reported by the API.
+            for stale_id in self._details_cache.keys() - active_device_ids_from_api:
+                del self._details_cache[stale_id]
 
-            for device_summary_item in device_summaries:
-                device_id = None # Initialize device_id here for broader scope in error handling
-                try:
-                    if not isinstance(device_summary_item, dict):
-                        _LOGGER.error("Invalid device summary data format: %s", device_summary_item)
+            if full_device_items is not None:
+                for item in full_device_items:
+                    try:
+                        result = self._process_full_device_item(item)
+                    except Exception as item_err:
+                        # Match the fallback path's isolation: one malformed
+                        # item degrades only its device, not the whole update.
+                        raw_device_id = item.get("device_id") if type(item) is dict else None
+                        _LOGGER.error(
+                            "Error processing batched device data for %s: %s",
+                            raw_device_id or "unknown", str(item_err),
+                        )
+                        if raw_device_id:
+                            device_id = str(raw_device_id)
+                            cached_entry = self._device_entry_cache.get(device_id)
+                            if cached_entry is not None:
+                                data[device_id] = {**cached_entry, "available": False}
+                            else:
+                                data[device_id] = {
+                                    "device": {"device_id": device_id, "name": item.get("name", device_id), "channels": []},
+                                    "status": {}, "available": False}
                         continue
-                    
-                    device_id = str(device_summary_item.get("device_id"))
-                    if not device_id:
-                        _LOGGER.error("Device summary missing device_id: %s", device_summary_item)
+                    if result is not None:
+                        device_id, device_entry = result
+                        data[device_id] = device_entry
+            else:
+                # Grab all statuses in one round-trip where the server allows
+                # it, skipping devices currently in backoff.
+                now = time.monotonic()
+                prefetched_statuses = await self.api.get_statuses(
+                    [did for did in active_device_ids_from_api if self._next_probe.get(did, 0) <= now]
+                )
+                # Fetch all devices concurrently so update time scales with the
+                # slowest device rather than the sum of all round-trips.
+                results = await asyncio.gather(
+                    *(self._fetch_one_device_bounded(item, prefetched_statuses) for item in device_summaries),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        # _fetch_one_device catches per-device errors itself, so this
+                        # only triggers on unexpected failures (e.g. cancellation).
+                        _LOGGER.error("Unexpected error fetching device data: %s", result, exc_info=result)
                         continue
-                    
-                    # Fetch full device details to get complete channel information
-                    full_device_details = await self.api.get_device_details(device_id)
-                    if not isinstance(full_device_details, dict):
-                        _LOGGER.error("Invalid full device details format for %s: %s", device_id, full_device_details)
-                        data[device_id] = { # Store minimal info to mark as unavailable
-                            "device": {"device_id": device_id, "name": device_summary_item.get("name", device_id), "channels": []},
-                            "status": {}, "available": False}
+                    if result is None:
                         continue
+                    device_id, device_entry = result
+                    data[device_id] = device_entry
 
-                    status = await self.api.get_device_status(device_id)
-                    
-                    # Ensure channels exist and are properly formatted (from full_device_details)
-                    channels_from_full_details = full_device_details.get("channels", [])
-                    if not isinstance(channels_from_full_details, list):
-                        _LOGGER.error("Invalid channels format in full details for device %s: %s", device_id, channels_from_full_details)
-                        channels_from_full_details = []
-                        
-                    # Process each channel
-                    processed_channels_data = []
-                    for channel_api_data in channels_from_full_details: # Use channels from full details
-                        if isinstance(channel_api_data, dict):
-                            channel_id_pk = channel_api_data.get("id")
-                            channel_idx_display = channel_api_data.get("channel_index")
-                            
-                            if channel_id_pk is not None and channel_idx_display is not None:
-                                processed_channels_data.append(channel_api_data)
-                            else:
-                                # This error should ideally not happen now if full_device_details.channels is used
-                                # and Channel schema guarantees 'id' and 'channel_index'.
-                                _LOGGER.error(
-                                    "Channel data from full details for device %s missing 'id' or 'channel_index': %s. This may indicate an API inconsistency.",
-                                    device_id,
-                                    channel_api_data,
-                                )
-                        else:
-                            _LOGGER.error(
-                                "Invalid channel format in full details for device %s: %s", device_id, channel_api_data
-                            )
-                    
-                    # Update the 'channels' in the full_device_details object that will be stored.
-                    full_device_details["channels"] = processed_channels_data
-                    
-                    data[device_id] = {
-                        "device": full_device_details, # Store the full device details
-                        "status": status,
-                        "available": True
-                    }
-                except Exception as device_err:
-                    _LOGGER.error("Error processing device %s: %s", device_id or device_summary_item.get("device_id", "unknown"), str(device_err), exc_info=True)
-                    # Mark this specific device as unavailable if we have an ID for it
-                    current_device_id_for_error = device_id or str(device_summary_item.get("device_id","unknown_device_at_error"))
-                    data[current_device_id_for_error] = {
-                        "device": {"device_id": current_device_id_for_error, "name": device_summary_item.get("name", current_device_id_for_error), "channels": []}, 
-                        "status": {},
-                        "available": False 
-                    }
-                    continue # Continue with the next device summary
-            
             # Handle devices that were previously in coordinator.data but are no longer reported by the API
             if self.data: # Check if coordinator already has data
-                previous_device_ids = set(self.data.keys())
-                missing_device_ids = previous_device_ids - active_device_ids_from_api
+                # dict_keys supports set arithmetic directly; no need to
+                # materialize an intermediate set of the previous ids.
+                missing_device_ids = self.data.keys() - active_device_ids_from_api
                 for missing_id in missing_device_ids:
-                    if missing_id in self.data and self.data[missing_id].get("available", False):
+                    previous_entry = self.data[missing_id]
+                    if previous_entry.get("available", False):
                         _LOGGER.info("Device %s previously available, now missing from API response. Marking unavailable.", missing_id)
                         # Preserve existing device and status structure but mark as unavailable
-                        data[missing_id] = self.data[missing_id].copy()
-                        data[missing_id]["available"] = False
+                        data[missing_id] = {**previous_entry, "available": False}
                     elif missing_id not in data : # If not already handled (e.g. by an error above)
                          data[missing_id] = {
                             "device": {"device_id": missing_id, "name": f"Device {missing_id} (removed)", "channels": []},
@@ -173,6 +432,14 @@ class PlantSipDataUpdateCoordinator(DataUpdateCoordinator):
                 self.last_update_success = False
                 raise UpdateFailed("No device data could be fetched")
                 
+            self.channel_index = {
+                (device_id, channel["id"]): channel
+                for device_id, entry in data.items()
+                for channel in entry.get("device", {}).get("channels", ())
+            }
+
+            self._update_firmware_versions(data)
+
             self.last_update_success = True
             return data
             
@@ -1,94 +1,276 @@
 """API client for PlantSip."""
 import asyncio
+import copy
 import logging
+import random
+import time
 from typing import Any, Dict, List
 
 import aiohttp
+import orjson
 from aiohttp import ClientError, ClientTimeout
 
 from .exceptions import (
     PlantSipApiError,
     PlantSipAuthError,
     PlantSipConnectionError,
+    PlantSipNotFoundError,
+    PlantSipServerError,
 )
-from .const import API_KEY_NAME
+from .const import API_KEY_NAME, MAX_CONCURRENT_REQUESTS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Transient-failure retries; the total budget stays well under the
+# coordinator's update interval.
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 1.0  # seconds
+
 class PlantSipAPI:
     """API client for PlantSip."""
 
-    def __init__(self, host: str, session: aiohttp.ClientSession, api_key: str | None = None, timeout: int = 30) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        host: str,
+        session: aiohttp.ClientSession | None = None,
+        api_key: str | None = None,
+        timeout: int = 30,
+        connector: aiohttp.BaseConnector | None = None,
+    ) -> None:
+        """Initialize the API client.
+
+        When no session is passed, the client owns a dedicated session built
+        around a connector tuned for polling a single host — pooled
+        keepalive connections, bounded per-host concurrency and cached DNS —
+        and must be closed via async_close. Pass an existing session (e.g.
+        Home Assistant's shared one) for one-off use such as config flows.
+        """
         self._host = host.rstrip("/")
-        self._api_key = api_key
-        self._session = session
+        if session is not None:
+            self._session = session
+            self._owns_session = False
+        else:
+            if connector is None:
+                connector = aiohttp.TCPConnector(
+                    limit=2 * MAX_CONCURRENT_REQUESTS,
+                    limit_per_host=MAX_CONCURRENT_REQUESTS,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True,
+                )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
         self._timeout = ClientTimeout(total=timeout)
+        self.set_api_key(api_key)
+        # None until the first batch request tells us whether the server
+        # supports it; False afterwards if the route returned 404.
+        self._batch_devices_supported: bool | None = None
+        self._batch_status_supported: bool | None = None
+        # In-flight GET coalescing: concurrent identical GETs (e.g. a switch
+        # action racing a coordinator refresh) share one network round-trip.
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        # Computed paths for per-device endpoints hit every update cycle.
+        self._status_paths: dict[str, str] = {}
+        self._details_paths: dict[str, str] = {}
+        self._water_paths: dict[tuple[str, int], str] = {}
+        self._channel_paths: dict[tuple[str, int], str] = {}
+        # Short-TTL cache of parsed GET responses: entity setup and bursty
+        # refreshes re-request the same resources within seconds. Cached
+        # payloads are deep-copied on store and read so callers stay isolated.
+        self._cache: dict[tuple, tuple[float, Any]] = {}
+        self._cache_ttl = 3.0  # seconds
+
+    def set_api_key(self, api_key: str | None) -> None:
+        """Set the API key and rebuild the precomputed default headers.
+
+        The headers are computed once here rather than per request; _request
+        never mutates them and aiohttp does not either, so the same dict is
+        reused for every call instead of being rebuilt on the hot path.
+        Calling this on an existing client (e.g. after a credentials
+        exchange in the config flow) lets it be reused for authenticated
+        requests without constructing a second client.
+        """
+        self._api_key = api_key
+        self._default_headers = {"Content-Type": "application/json"}
+        if api_key:
+            self._default_headers["X-API-Key"] = api_key  # Standard header for API keys
+        self._redacted_default_headers = {
+            k: (v[:10] + "..." if k == "X-API-Key" else v)
+            for k, v in self._default_headers.items()
+        }
+
+    async def async_close(self) -> None:
+        """Close the underlying session if this client owns it."""
+        if self._owns_session and not self._session.closed:
+            await self._session.close()
 
     async def _request(self, method: str, path: str, headers_override: dict | None = None, **kwargs) -> Any:
-        """Make a request to the API."""
-        headers = {}
+        """Make a request to the API, coalescing concurrent identical GETs.
+
+        Idempotent GETs already in flight are shared: later callers await the
+        first caller's future instead of issuing a duplicate request.
+        Non-GET methods and calls with header overrides bypass the cache.
+        """
+        # Single auth guard instead of one per public method: every call
+        # needs either the API key or an explicit header override (the
+        # bearer-token step of the credentials exchange).
+        if not self._api_key and not headers_override:
+            raise PlantSipAuthError(f"API key not set for {method} {path} request.")
+
+        if method != "GET" or headers_override:
+            return await self._execute_request(method, path, headers_override, **kwargs)
+
+        params = kwargs.get("params")
+        key = (path, tuple(sorted(params.items())) if params else None)
+
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return copy.deepcopy(cached[1])
+
+        existing = self._inflight.get(key)
+        if existing is not None:
+            # Copy per waiter: callers mutate payloads in place (status pop,
+            # channel sort), so sharing the executing caller's object would
+            # leak half-mutated responses. Same isolation as a cache hit.
+            return copy.deepcopy(await existing)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._execute_request(method, path, headers_override, **kwargs)
+        except BaseException as err:
+            future.set_exception(err)
+            # Mark retrieved in case no other caller was waiting on it.
+            future.exception()
+            raise
+        else:
+            self._cache[key] = (time.monotonic(), copy.deepcopy(result))
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    def _invalidate_cache_for_device(self, device_id: str) -> None:
+        """Drop cached GET responses touching a device after a write."""
+        for key in [k for k in self._cache if device_id in k[0]]:
+            del self._cache[key]
+        # The device list embeds per-device data on the batched route.
+        for key in [k for k in self._cache if k[0].startswith("/devices")]:
+            del self._cache[key]
+
+    async def _execute_request(self, method: str, path: str, headers_override: dict | None = None, expect_response: bool = True, **kwargs) -> Any:
+        """Perform a request, retrying transient failures for safe methods.
+
+        Connection errors and 5xx responses on idempotent methods (GET/PUT)
+        are retried with jittered exponential backoff; POST is never retried
+        (a repeated watering trigger would water twice) and auth/4xx errors
+        surface immediately.
+        """
+        if method == "POST":
+            return await self._send_request(method, path, headers_override, expect_response=expect_response, **kwargs)
+
+        last_err: Exception | None = None
+        for attempt in range(RETRY_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(RETRY_BACKOFF_BASE * 2 ** (attempt - 1) + random.uniform(0, 0.5))
+            try:
+                return await self._send_request(method, path, headers_override, expect_response=expect_response, **kwargs)
+            except (PlantSipConnectionError, PlantSipServerError) as err:
+                last_err = err
+                _LOGGER.debug(
+                    "Transient error on %s %s (attempt %d/%d): %s",
+                    method, path, attempt + 1, RETRY_ATTEMPTS, err,
+                )
+        raise last_err
+
+    async def _send_request(self, method: str, path: str, headers_override: dict | None = None, expect_response: bool = True, **kwargs) -> Any:
+        """Perform a single request to the API.
+
+        With expect_response=False the body is never read, which skips the
+        read + decode for write endpoints whose response carries no data.
+        """
+        # Serialize JSON bodies with orjson up front instead of letting
+        # aiohttp run stdlib json.dumps in the event loop.
+        json_body = kwargs.pop("json", None)
+        if json_body is not None:
+            kwargs["data"] = orjson.dumps(json_body)
+
         if headers_override:
-            headers.update(headers_override)
-        elif self._api_key:
-            headers["X-API-Key"] = self._api_key  # Standard header for API keys
-        
-        headers.setdefault("Content-Type", "application/json")
+            headers = dict(headers_override)
+            headers.setdefault("Content-Type", "application/json")
+            redacted_headers = headers
+        else:
+            headers = self._default_headers
+            redacted_headers = self._redacted_default_headers
 
-        url = f"{self._host}{path}"
+        url = self._host + path
 
-        _LOGGER.debug("Requesting %s %s with headers %s and data %s", method, url, {k: (v[:10] + "..." if k == "X-API-Key" else v) for k,v in headers.items()}, kwargs.get("json"))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Requesting %s %s with headers %s and data %s", method, url, redacted_headers, json_body)
 
 
         try:
+            # Apply the shared default timeout only when the caller did not
+            # pass one, so an explicit timeout= kwarg cannot collide.
+            kwargs.setdefault("timeout", self._timeout)
             async with self._session.request(
-                method, url, headers=headers, timeout=self._timeout, **kwargs
+                method, url, headers=headers, **kwargs
             ) as response:
-                response_text = None
-                try:
-                    response_text = await response.text() if response.content_length != 0 else "No content"
-                except Exception as text_err:
-                    _LOGGER.warning("Failed to read response text: %s", text_err)
-                    response_text = "<Failed to read response>"
-                
-                _LOGGER.debug("Response status: %s, body: %s", response.status, response_text)
-                
+                _LOGGER.debug("Response status for %s %s: %s", method, url, response.status)
+
                 if response.status == 401:
                     raise PlantSipAuthError("Invalid authentication credentials")
                 if response.status == 403:
                     raise PlantSipAuthError("Forbidden. Check API key permissions or validity.")
                 if response.status == 404:
-                    raise PlantSipApiError(f"Resource not found: {url}")
-                if response.status >= 500:
-                    raise PlantSipApiError(f"Server error {response.status}: {response_text}")
+                    raise PlantSipNotFoundError(f"Resource not found: {url}")
                 if response.status >= 400:
+                    # Only error paths need the body text (for the message).
+                    response_text = await self._safe_read_text(response)
+                    if response.status >= 500:
+                        raise PlantSipServerError(f"Server error {response.status}: {response_text}")
                     raise PlantSipApiError(f"API request failed with status {response.status}: {response_text}")
-                
+
+                # content_length is None for chunked transfers, so check the
+                # status as well; only a literal 0 means a known-empty body.
+                if not expect_response or response.status == 204 or response.content_length == 0:
+                    return None
+
                 if response.content_type == "application/json":
                     try:
-                        return await response.json()
+                        # orjson decodes noticeably faster than stdlib json;
+                        # this runs for every coordinator update.
+                        return orjson.loads(await response.read())
                     except Exception as json_err:
                         _LOGGER.error("Failed to parse JSON response: %s", json_err)
                         raise PlantSipApiError(f"Invalid JSON response: {json_err}")
-                return response_text
+                return await self._safe_read_text(response)
 
         except ClientError as err:
             raise PlantSipConnectionError(f"Failed to connect to PlantSip API: {err}") from err
         except asyncio.TimeoutError as err:
             raise PlantSipConnectionError("Timeout while connecting to PlantSip API") from err
 
+    @staticmethod
+    async def _safe_read_text(response: aiohttp.ClientResponse) -> str:
+        """Read a response body as text without raising."""
+        if response.content_length == 0:
+            return "No content"
+        try:
+            return await response.text()
+        except Exception as text_err:
+            _LOGGER.warning("Failed to read response text: %s", text_err)
+            return "<Failed to read response>"
+
     async def get_devices(self) -> List[Dict[str, Any]]:
         """Get all devices."""
-        if not self._api_key:
-            raise PlantSipAuthError("API key not set for get_devices request.")
         response = await self._request("GET", "/devices/") # Added trailing slash based on openapi
-        _LOGGER.debug("Got devices response: %s", response)
-        
         # Handle different response formats
         if isinstance(response, dict) and "items" in response:
             devices = response.get("items", [])
             if not isinstance(devices, list):
                 raise PlantSipApiError(f"Invalid devices data format: expected list in 'items', got {type(devices)}")
+            _LOGGER.debug("Got %d devices", len(devices))
             return devices
         elif isinstance(response, list):
             # Fallback for non-paginated list, though OpenAPI implies pagination
@@ -97,27 +279,127 @@ class PlantSipAPI:
         else:
             raise PlantSipApiError(f"Unexpected response format for devices: {type(response)}, content: {response}")
 
+    async def get_all_devices_full(self) -> List[Dict[str, Any]] | None:
+        """Get all devices with channels and latest status in a single request.
+
+        Returns None if the server does not support the batched route; the
+        outcome of that feature detection is cached so the 404 is only paid
+        once per API instance.
+        """
+        if self._batch_devices_supported is False:
+            return None
+        try:
+            response = await self._request(
+                "GET", "/devices/", params={"include": "channels,status"}
+            )
+        except PlantSipNotFoundError:
+            _LOGGER.debug("Batched devices route not supported by server, falling back to per-device requests.")
+            self._batch_devices_supported = False
+            return None
+        if isinstance(response, dict) and "items" in response:
+            devices = response.get("items", [])
+            if not isinstance(devices, list):
+                raise PlantSipApiError(f"Invalid devices data format: expected list in 'items', got {type(devices)}")
+        elif isinstance(response, list):
+            devices = response
+        else:
+            raise PlantSipApiError(f"Unexpected response format for devices: {type(response)}, content: {response}")
+
+        # The batched route is the plain list route plus a query param, so a
+        # server that ignores unknown params still answers 200 — with bare
+        # summaries. Only commit to the batched path when the items really
+        # embed the extra fields; otherwise cache unsupported and fall back.
+        # An empty list proves nothing either way, so leave the capability
+        # undecided in that case.
+        if not devices:
+            return devices
+        if not any(
+            isinstance(device, dict) and ("status" in device or "channels" in device)
+            for device in devices
+        ):
+            _LOGGER.debug("Server ignored the include param on /devices/, falling back to per-device requests.")
+            self._batch_devices_supported = False
+            return None
+        self._batch_devices_supported = True
+        return devices
+
     async def get_device_details(self, device_id: str) -> Dict[str, Any]:
         """Get full details of a specific device."""
-        if not self._api_key:
-            raise PlantSipAuthError("API key not set for get_device_details request.")
         if not device_id or not device_id.strip():
             raise PlantSipApiError("Device ID cannot be empty")
-        # Path: /devices/{device_id}, OperationId: read_device_devices__device_id__get
-        return await self._request("GET", f"/devices/{device_id.strip()}")
+        device_id = device_id.strip()
+        path = self._details_paths.get(device_id)
+        if path is None:
+            # Path: /devices/{device_id}, OperationId: read_device_devices__device_id__get
+            path = self._details_paths[device_id] = "/devices/" + device_id
+        return await self._request("GET", path)
 
     async def get_device_status(self, device_id: str) -> Dict[str, Any]:
         """Get status of a specific device."""
-        if not self._api_key:
-            raise PlantSipAuthError("API key not set for get_device_status request.")
         if not device_id or not device_id.strip():
             raise PlantSipApiError("Device ID cannot be empty")
-        return await self._request("GET", f"/device/{device_id.strip()}/status/latest")
+        device_id = device_id.strip()
+        path = self._status_paths.get(device_id)
+        if path is None:
+            path = self._status_paths[device_id] = "/device/" + device_id + "/status/latest"
+        return await self._request("GET", path)
+
+    async def get_statuses(self, device_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the latest status for many devices at once.
 
-    async def trigger_watering(self, device_id: str, channel_id: int, water_amount: float) -> Dict[str, Any]:
+        Uses POST /device/status/batch when the server supports it (the
+        capability probe is cached like the batched devices route);
+        otherwise falls back to concurrent per-device status requests.
+        Devices whose status could not be fetched are absent from the
+        returned mapping.
+        """
+        ids = [device_id.strip() for device_id in device_ids if device_id and device_id.strip()]
+        if not ids:
+            return {}
+
+        if self._batch_status_supported is not False:
+            try:
+                response = await self._request("POST", "/device/status/batch", json={"ids": ids})
+            except PlantSipNotFoundError:
+                _LOGGER.debug("Batched status route not supported by server, falling back to per-device requests.")
+                self._batch_status_supported = False
+            except PlantSipAuthError:
+                # An auth problem affects the per-device requests just the
+                # same; let the coordinator handle it.
+                raise
+            except PlantSipError as err:
+                # The batch request is speculative (and POST is never
+                # retried), so a transient failure must not fail the whole
+                # update: fall back for this cycle and probe again next time.
+                _LOGGER.debug("Batched status request failed (%s), falling back to per-device requests.", err)
+            else:
+                if type(response) is dict:
+                    statuses = response.get("statuses", response)
+                    if type(statuses) is dict:
+                        self._batch_status_supported = True
+                        return statuses
+                # A 200 with an unexpected shape means the route is not what
+                # we expect; cache unsupported instead of failing every cycle.
+                _LOGGER.debug(
+                    "Unexpected response format for batched statuses (%s), falling back to per-device requests.",
+                    type(response),
+                )
+                self._batch_status_supported = False
+
+        results = await asyncio.gather(
+            *(self.get_device_status(device_id) for device_id in ids),
+            return_exceptions=True,
+        )
+        statuses: Dict[str, Dict[str, Any]] = {}
+        for device_id, result in zip(ids, results):
+            if isinstance(result, BaseException):
+                _LOGGER.debug("Status fetch failed for device %s: %s", device_id, result)
+                continue
+            statuses[device_id] = result
+        return statuses
+
+    async def trigger_watering(self, device_id: str, channel_id: int, water_amount: float) -> None:
         """Trigger manual watering for a specific channel."""
-        if not self._api_key:
-            raise PlantSipAuthError("API key not set for trigger_watering request.")
         if not device_id or not device_id.strip():
             raise PlantSipApiError("Device ID cannot be empty")
         if channel_id < 0:
@@ -127,26 +409,39 @@ class PlantSipAPI:
         if water_amount > 10000:  # Reasonable upper limit
             raise PlantSipApiError("Water amount too large (max 10000ml)")
         
-        return await self._request(
+        device_id = device_id.strip()
+        key = (device_id, channel_id)
+        path = self._water_paths.get(key)
+        if path is None:
+            path = self._water_paths[key] = f"/device/{device_id}/channel/{channel_id}/water"
+        result = await self._request(
             "POST",
-            f"/device/{device_id.strip()}/channel/{channel_id}/water",
+            path,
             json={"water_amount": water_amount},
+            expect_response=False,
         )
+        self._invalidate_cache_for_device(device_id)
+        return result
 
     async def update_channel_config(self, device_id: str, channel_id: int, config_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update channel configuration."""
-        if not self._api_key:
-            raise PlantSipAuthError("API key not set for update_channel_config request.")
         if not device_id or not device_id.strip():
             raise PlantSipApiError("Device ID cannot be empty")
         if channel_id < 0:
             raise PlantSipApiError("Channel ID must be non-negative")
         
-        return await self._request(
+        device_id = device_id.strip()
+        key = (device_id, channel_id)
+        path = self._channel_paths.get(key)
+        if path is None:
+            path = self._channel_paths[key] = f"/device/{device_id}/channel/{channel_id}"
+        result = await self._request(
             "PUT",
-            f"/device/{device_id.strip()}/channel/{channel_id}",
+            path,
             json=config_data,
         )
+        self._invalidate_cache_for_device(device_id)
+        return result
 
     async def exchange_credentials_for_api_key(self, username: str, password: str) -> str:
         """Login with username/password to get a short-lived token, then create and return a long-lived API key."""
@@ -155,12 +450,14 @@ class PlantSipAPI:
         if not password:
             raise PlantSipApiError("Password cannot be empty")
         
-        # Step 1: Get short-lived Bearer token
+        # Step 1: Get short-lived Bearer token. Not cached: the token would
+        # have to be keyed by the credentials that produced it, and the
+        # config flow builds a fresh client per submission anyway.
         token_url = f"{self._host}/token"
         login_data = {"username": username.strip(), "password": password}
         _LOGGER.debug("Attempting to get short-lived token from %s", token_url)
         try:
-            async with self._session.post(token_url, json=login_data) as response:
+            async with self._session.post(token_url, json=login_data, timeout=self._timeout) as response:
                 if response.status in (401, 422): # 422 for validation error (e.g. wrong body)
                     error_text = await response.text()
                     _LOGGER.error("Auth error getting token (%s): %s", response.status, error_text)
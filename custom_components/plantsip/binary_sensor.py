@@ -1,21 +1,16 @@
 """Binary sensor platform for PlantSip."""
 from __future__ import annotations
 
-import logging
-from typing import Optional
-
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-_LOGGER = logging.getLogger(__name__)
-
 from .const import DOMAIN, MANUFACTURER
 
 async def async_setup_entry(
@@ -26,15 +21,12 @@ async def async_setup_entry(
     """Set up PlantSip binary sensors."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     
-    entities = []
-    for device_id, device_data in coordinator.data.items():
-        if device_data.get("available", False):
-            entities.extend((
-                PlantSipPowerSupplyBinarySensor(coordinator, device_id),
-                PlantSipBatteryChargingBinarySensor(coordinator, device_id),
-            ))
-    
-    async_add_entities(entities)
+    async_add_entities(
+        entity_cls(coordinator, device_id)
+        for device_id, device_data in coordinator.data.items()
+        if device_data.get("available", False)
+        for entity_cls in (PlantSipPowerSupplyBinarySensor, PlantSipBatteryChargingBinarySensor)
+    )
 
 class PlantSipPowerSupplyBinarySensor(CoordinatorEntity, BinarySensorEntity):
     """Binary sensor for power supply status."""
@@ -45,7 +37,10 @@ class PlantSipPowerSupplyBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._device_id = device_id
         self._attr_device_class = BinarySensorDeviceClass.PLUG
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        
+        self._attr_unique_id = f"{device_id}_power_supply"
+        self._attr_translation_key = "power_supply"
+        self._attr_has_entity_name = True
+
         device_data = coordinator.data[device_id]["device"]
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, device_id)},
@@ -54,47 +49,39 @@ class PlantSipPowerSupplyBinarySensor(CoordinatorEntity, BinarySensorEntity):
             model="PlantSip Device",
             sw_version=coordinator.data[device_id]["status"]["firmware_version"],
         )
-        
-    @property
-    def unique_id(self):
-        """Return unique ID for the binary sensor."""
-        return f"{self._device_id}_power_supply"
-        
-    @property
-    def name(self):
-        """Return the name of the binary sensor."""
-        device_name = self.coordinator.data[self._device_id]["device"]["name"]
-        return f"{device_name} {self.translation_key}"
+        self._attr_available = False
+        self._attr_is_on = None
+        self._status = {}
+        self._update_from_coordinator()
 
-    @property
-    def translation_key(self) -> str:
-        """Return the translation key."""
-        return "power_supply"
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Recompute cached availability and state from coordinator data."""
+        entry = self.coordinator.data.get(self._device_id) or {}
+        self._status = entry.get("status") or {}
+        self._attr_available = bool(
+            self.coordinator.last_update_success and entry.get("available")
+        )
+        if not self._attr_available:
+            self._attr_is_on = None
+            return
+        power_connected = self._status.get("power_supply_connected")
+        self._attr_is_on = (
+            power_connected
+            if power_connected is True or power_connected is False
+            else None
+        )
 
-    @property
-    def is_on(self) -> Optional[bool]:
-        """Return true if power supply is connected."""
-        if not self.available:
-            return None
-            
-        try:
-            status = self.coordinator.data[self._device_id]["status"]
-            power_connected = status.get("power_supply_connected")
-            if isinstance(power_connected, bool):
-                return power_connected
-            return None
-        except (KeyError, TypeError) as err:
-            _LOGGER.warning("Error getting power supply status for device %s: %s", self._device_id, err)
-            return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data
-            and self.coordinator.data[self._device_id].get("available", False)
-        )
+        return self._attr_available
 
 class PlantSipBatteryChargingBinarySensor(CoordinatorEntity, BinarySensorEntity):
     """Binary sensor for battery charging status."""
@@ -105,7 +92,10 @@ class PlantSipBatteryChargingBinarySensor(CoordinatorEntity, BinarySensorEntity)
         self._device_id = device_id
         self._attr_device_class = BinarySensorDeviceClass.BATTERY_CHARGING
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        
+        self._attr_unique_id = f"{device_id}_battery_charging"
+        self._attr_translation_key = "battery_charging"
+        self._attr_has_entity_name = True
+
         device_data = coordinator.data[device_id]["device"]
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, device_id)},
@@ -114,44 +104,36 @@ class PlantSipBatteryChargingBinarySensor(CoordinatorEntity, BinarySensorEntity)
             model="PlantSip Device",
             sw_version=coordinator.data[device_id]["status"]["firmware_version"],
         )
-        
-    @property
-    def unique_id(self):
-        """Return unique ID for the binary sensor."""
-        return f"{self._device_id}_battery_charging"
-        
-    @property
-    def name(self):
-        """Return the name of the binary sensor."""
-        device_name = self.coordinator.data[self._device_id]["device"]["name"]
-        return f"{device_name} {self.translation_key}"
+        self._attr_available = False
+        self._attr_is_on = None
+        self._status = {}
+        self._update_from_coordinator()
 
-    @property
-    def translation_key(self) -> str:
-        """Return the translation key."""
-        return "battery_charging"
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Recompute cached availability and state from coordinator data."""
+        entry = self.coordinator.data.get(self._device_id) or {}
+        self._status = entry.get("status") or {}
+        self._attr_available = bool(
+            self.coordinator.last_update_success and entry.get("available")
+        )
+        if not self._attr_available:
+            self._attr_is_on = None
+            return
+        battery_charging = self._status.get("battery_charging")
+        self._attr_is_on = (
+            battery_charging
+            if battery_charging is True or battery_charging is False
+            else None
+        )
 
-    @property
-    def is_on(self) -> Optional[bool]:
-        """Return true if battery is charging."""
-        if not self.available:
-            return None
-            
-        try:
-            status = self.coordinator.data[self._device_id]["status"]
-            battery_charging = status.get("battery_charging")
-            if isinstance(battery_charging, bool):
-                return battery_charging
-            return None
-        except (KeyError, TypeError) as err:
-            _LOGGER.warning("Error getting battery charging status for device %s: %s", self._device_id, err)
-            return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data
-            and self.coordinator.data[self._device_id].get("available", False)
-        )
+        return self._attr_available
